@@ -8,15 +8,15 @@ from unittest import mock
 import ddt
 import httpretty
 from django.conf import settings
-from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
+from django.contrib.auth.models import AnonymousUser, User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.core import mail
 from django.core.cache import cache
-from django.test import TransactionTestCase
+from django.db.models import Exists, OuterRef
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from django.urls import reverse
 from pytz import UTC
-from social_django.models import Partial, UserSocialAuth
+from social_django.models import UserSocialAuth
 from testfixtures import LogCapture
 from openedx_events.tests.utils import OpenEdxEventsTestMixin
 
@@ -49,6 +49,7 @@ from openedx.core.djangoapps.user_api.accounts.tests.retirement_helpers import (
 from openedx.core.djangoapps.user_api.tests.test_constants import SORTED_COUNTRIES
 from openedx.core.djangoapps.user_api.tests.test_helpers import TestCaseForm
 from openedx.core.djangoapps.user_api.tests.test_views import UserAPITestCase
+from openedx.core.djangoapps.user_authn.views.register import RegistrationView
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase, skip_unless_lms
 from openedx.core.lib.api import test_utils
 from common.djangoapps.student.helpers import authenticate_new_user
@@ -69,6 +70,31 @@ from common.djangoapps.util.password_policy_validators import (
 ENABLE_AUTO_GENERATED_USERNAME = settings.FEATURES.copy()
 ENABLE_AUTO_GENERATED_USERNAME['ENABLE_AUTO_GENERATED_USERNAME'] = True
 
+# Expected registration form select options. These are static, so build them
+# once at import time instead of in every test that asserts on them.
+_THIS_YEAR = datetime.now(UTC).year
+YEAR_OF_BIRTH_OPTIONS = [{"value": "", "name": "--", "default": True}] + [
+    {"value": str(year), "name": str(year), "default": False}
+    for year in range(_THIS_YEAR, _THIS_YEAR - 120, -1)
+]
+COUNTRY_OPTIONS = [
+    {"value": country_code, "name": str(country_name), "default": False}
+    for country_code, country_name in SORTED_COUNTRIES
+]
+COUNTRY_OPTION_INDEX = {option["value"]: index for index, option in enumerate(COUNTRY_OPTIONS)}
+# Keys that every field in the registration form description has, with their default values.
+_DEFAULT_FIELD = {
+    "label": "",
+    "instructions": "",
+    "placeholder": "",
+    "defaultValue": "",
+    "restrictions": {},
+    "errorMessages": {},
+}
+# The field order tests only look at field names, so a short country list is enough.
+REGISTRATION_FORM_COUNTRIES = "openedx.core.djangoapps.user_authn.views.registration_form.countries"
+FIELD_ORDER_COUNTRIES = [("US", "United States"), ("CA", "Canada"), ("XK", "Kosovo")]
+
 
 @ddt.ddt
 @skip_unless_lms
@@ -76,8 +102,8 @@ class RegistrationViewValidationErrorTest(
     ThirdPartyAuthTestMixin, UserAPITestCase, RetirementTestCase, OpenEdxEventsTestMixin
 ):
     """
-    Tests for catching duplicate email and username validation errors within
-    the registration end-points of the User API.
+    Tests for catching validation errors within the registration
+    end-points of the User API.
     """
 
     ENABLED_OPENEDX_EVENTS = []
@@ -105,10 +131,20 @@ class RegistrationViewValidationErrorTest(
         """
         super().setUpClass()
         cls.start_events_isolation()
+        cls.url = reverse("user_api_registration")
 
-    def setUp(self):  # pylint: disable=arguments-differ
-        super().setUp()
-        self.url = reverse("user_api_registration")
+    def _register(self, **overrides):
+        """
+        POST a registration for the default user, overriding any of its fields.
+        """
+        return self.client.post(self.url, {
+            "email": self.EMAIL,
+            "name": self.NAME,
+            "username": self.USERNAME,
+            "password": self.PASSWORD,
+            "honor_code": "true",
+            **overrides,
+        })
 
     @mock.patch.dict(settings.FEATURES, {
         "ENABLE_THIRD_PARTY_AUTH": True,
@@ -119,177 +155,18 @@ class RegistrationViewValidationErrorTest(
     )
     def test_register_public_account_with_only_third_party_auth_failure(self):
         # fails to register for public user if only third party auth is allowed
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
+        response = self._register()
         assert response.status_code == 403
         assert response.content == (b"Third party authentication is required to register. "
                                     b"Username and password were received instead.")
 
-    def test_register_retired_email_validation_error(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
-
-        # Initiate retirement for the above user:
-        fake_requested_retirement(User.objects.get(username=self.USERNAME))
-
-        # Try to create a second user with the same email address as the retired user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": "Someone Else",
-            "username": "someone_else",
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        assert response.status_code == 409
-
-        response_json = json.loads(response.content.decode('utf-8'))
-        self.assertDictEqual(
-            response_json,
-            {
-                "email": [{
-                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
-                }],
-                "error_code": "duplicate-email"
-            }
-        )
-
-    def test_register_duplicate_retired_username_account_validation_error(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
-
-        # Initiate retirement for the above user.
-        fake_requested_retirement(User.objects.get(username=self.USERNAME))
-
-        with mock.patch('openedx.core.djangoapps.user_authn.views.register.do_create_account') as dummy_do_create_acct:
-            # do_create_account should *not* be called - the duplicate retired username
-            # should be detected before account creation is called.
-            dummy_do_create_acct.side_effect = Exception('do_create_account should *not* have been called!')
-            # Try to create a second user with the same username.
-            response = self.client.post(self.url, {
-                "email": "someone+else@example.com",
-                "name": "Someone Else",
-                "username": self.USERNAME,
-                "password": self.PASSWORD,
-                "honor_code": "true",
-            })
-
-        assert response.status_code == 409
-
-        response_json = json.loads(response.content.decode('utf-8'))
-        username_suggestions = response_json.pop('username_suggestions')
-        assert len(username_suggestions) == 3
-        self.assertDictEqual(
-            response_json,
-            {
-                "username": [{
-                    "user_message": AUTHN_USERNAME_CONFLICT_MSG,
-                }],
-                "error_code": "duplicate-username"
-            }
-        )
-
-    def test_register_duplicate_email_validation_error(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
-
-        # Try to create a second user with the same email address
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": "Someone Else",
-            "username": "someone_else",
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-
-        assert response.status_code == 409
-
-        response_json = json.loads(response.content.decode('utf-8'))
-        self.assertDictEqual(
-            response_json,
-            {
-                "email": [{
-                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
-                }],
-                "error_code": "duplicate-email"
-            }
-        )
-
-    def test_register_duplicate_email_validation_error_with_recovery(self):
-        # Register the user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
-
-        # Create recovery object
-        user = User.objects.get(email=self.EMAIL)
-        account_recovery = AccountRecoveryFactory(user=user)
-
-        # Try to create a user with the recovery email address
-        response = self.client.post(self.url, {
-            "email": account_recovery.secondary_email,
-            "name": "Someone Else",
-            "username": "someone_else",
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-
-        assert response.status_code == 409
-
-        response_json = json.loads(response.content.decode('utf-8'))
-        self.assertDictEqual(
-            response_json,
-            {
-                "email": [{
-                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
-                }],
-                "error_code": "duplicate-email"
-            }
-        )
-
     def test_register_fullname_url_validation_error(self):
         """
         Test for catching invalid full name errors
         """
-        response = self.client.post(self.url, {
-            "email": "bob@example.com",
-            "name": "Bob Smith http://test.com",
-            "username": "bob",
-            "password": "password",
-            "honor_code": "true",
-        })
+        response = self._register(name="Bob Smith http://test.com")
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -299,15 +176,9 @@ class RegistrationViewValidationErrorTest(
         )
 
         # testing for http/https
-        response = self.client.post(self.url, {
-            "email": "bob@example.com",
-            "name": "http://",
-            "username": "bob",
-            "password": "password",
-            "honor_code": "true",
-        })
+        response = self._register(name="http://")
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -322,16 +193,10 @@ class RegistrationViewValidationErrorTest(
         """
         expected_error_message = f"Your legal name is too long. It must not exceed {NAME_MAX_LENGTH} characters"
 
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": "x" * 256,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
+        response = self._register(name="x" * 256)
         assert response.status_code == 400
 
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -344,15 +209,9 @@ class RegistrationViewValidationErrorTest(
         """
         Test for catching invalid full name errors
         """
-        response = self.client.post(self.url, {
-            "email": "bob@example.com",
-            "name": "<Bob Smith>",
-            "username": "bob",
-            "password": "password",
-            "honor_code": "true",
-        })
+        response = self._register(name="<Bob Smith>")
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -361,27 +220,95 @@ class RegistrationViewValidationErrorTest(
             }
         )
 
-    def test_register_duplicate_username_account_validation_error(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+    def test_invalid_country_code_error(self):
+        response = self._register(country="Invalid country code")
 
-        # Try to create a second user with the same username
-        response = self.client.post(self.url, {
-            "email": "someone+else@example.com",
+        response_json = response.json()
+        self.assertHttpBadRequest(response)
+        self.assertDictEqual(
+            response_json,
+            {
+                "country": [{
+                    "user_message": REQUIRED_FIELD_COUNTRY_MSG,
+                }],
+                "error_code": "invalid-country"
+            }
+        )
+
+
+@ddt.ddt
+@skip_unless_lms
+class RegistrationViewDuplicateValidationErrorTest(
+    ThirdPartyAuthTestMixin, UserAPITestCase, RetirementTestCase, OpenEdxEventsTestMixin
+):
+    """
+    Tests for catching duplicate email and username validation errors within
+    the registration end-points of the User API.
+    """
+
+    ENABLED_OPENEDX_EVENTS = []
+
+    maxDiff = None
+
+    USERNAME = "bob"
+    EMAIL = "bob@example.com"
+    PASSWORD = "password"
+    NAME = "Bob Smith"
+    COUNTRY = "US"
+
+    request_factory = RequestFactory()
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up class method for the Test class.
+
+        This method starts manually events isolation. Explanation here:
+        openedx/core/djangoapps/user_authn/views/tests/test_events.py#L44
+        """
+        super().setUpClass()
+        cls.start_events_isolation()
+        cls.url = reverse("user_api_registration")
+
+    @classmethod
+    def setUpTestData(cls):  # lint-amnesty, pylint: disable=super-method-not-called
+        # The user every test in this class tries to collide with.
+        cls.existing_user = UserFactory(username=cls.USERNAME, email=cls.EMAIL)
+
+    def _post_registration(self, **overrides):
+        """
+        Call the registration view directly, bypassing the middleware stack.
+
+        By default this registers someone else with the existing user's email
+        and username; pass keyword arguments to override any field.
+
+        These tests only exercise the duplicate-detection branch of
+        RegistrationView.post, which doesn't depend on the session or cookies.
+        """
+        request = self.request_factory.post(self.url, {
+            "email": self.EMAIL,
             "name": "Someone Else",
             "username": self.USERNAME,
             "password": self.PASSWORD,
             "honor_code": "true",
+            **overrides,
         })
+        request.user = AnonymousUser()
+        return RegistrationView.as_view()(request)
+
+    def test_register_duplicate_retired_username_account_validation_error(self):
+        # Initiate retirement for the existing user.
+        fake_requested_retirement(self.existing_user)
+
+        with mock.patch('openedx.core.djangoapps.user_authn.views.register.do_create_account') as dummy_do_create_acct:
+            # do_create_account should *not* be called - the duplicate retired username
+            # should be detected before account creation is called.
+            dummy_do_create_acct.side_effect = Exception('do_create_account should *not* have been called!')
+            # Try to create a second user with the same username.
+            response = self._post_registration(email="someone+else@example.com")
 
         assert response.status_code == 409
+
         response_json = json.loads(response.content.decode('utf-8'))
         username_suggestions = response_json.pop('username_suggestions')
         assert len(username_suggestions) == 3
@@ -395,66 +322,54 @@ class RegistrationViewValidationErrorTest(
             }
         )
 
-    def test_register_duplicate_username_and_email_validation_errors(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+    @ddt.data(False, True)
+    def test_register_duplicate_email_validation_error(self, retired):
+        if retired:
+            # Initiate retirement for the existing user; its email must still be rejected.
+            fake_requested_retirement(self.existing_user)
 
-        # Try to create a second user with the same username and email
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": "Someone Else",
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
+        # Try to create a second user with the same email address
+        response = self._post_registration(username="someone_else")
 
         assert response.status_code == 409
+
         response_json = json.loads(response.content.decode('utf-8'))
-        username_suggestions = response_json.pop('username_suggestions')
-        assert len(username_suggestions) == 3
         self.assertDictEqual(
             response_json,
             {
-                "username": [{
-                    "user_message": AUTHN_USERNAME_CONFLICT_MSG,
-                }],
                 "email": [{
                     "user_message": AUTHN_EMAIL_CONFLICT_MSG,
                 }],
-                "error_code": "duplicate-email-username"
+                "error_code": "duplicate-email"
             }
         )
 
-    def test_duplicate_email_username_error(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+    def test_register_duplicate_email_validation_error_with_recovery(self):
+        # Create recovery object
+        account_recovery = AccountRecoveryFactory(user=self.existing_user)
 
-        # Try to create a second user with the same username and email
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": "Someone Else",
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "country": self.COUNTRY,
-            "honor_code": "true",
-        })
+        # Try to create a user with the recovery email address
+        response = self._post_registration(email=account_recovery.secondary_email, username="someone_else")
+
+        assert response.status_code == 409
 
         response_json = json.loads(response.content.decode('utf-8'))
+        self.assertDictEqual(
+            response_json,
+            {
+                "email": [{
+                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
+                }],
+                "error_code": "duplicate-email"
+            }
+        )
+
+    def test_register_duplicate_username_account_validation_error(self):
+        # Try to create a second user with the same username
+        response = self._post_registration(email="someone+else@example.com")
+
         assert response.status_code == 409
+        response_json = json.loads(response.content.decode('utf-8'))
         username_suggestions = response_json.pop('username_suggestions')
         assert len(username_suggestions) == 3
         self.assertDictEqual(
@@ -463,32 +378,29 @@ class RegistrationViewValidationErrorTest(
                 "username": [{
                     "user_message": AUTHN_USERNAME_CONFLICT_MSG,
                 }],
-                "email": [{
-                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
-                }],
-                "error_code": "duplicate-email-username"
+                "error_code": "duplicate-username"
             }
         )
 
-    def test_invalid_country_code_error(self):
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "country": "Invalid country code",
-            "honor_code": "true",
-        })
+    @ddt.data({}, {"country": COUNTRY})
+    def test_register_duplicate_username_and_email_validation_errors(self, extra_data):
+        # Try to create a second user with the same username and email
+        response = self._post_registration(**extra_data)
 
+        assert response.status_code == 409
         response_json = json.loads(response.content.decode('utf-8'))
-        self.assertHttpBadRequest(response)
+        username_suggestions = response_json.pop('username_suggestions')
+        assert len(username_suggestions) == 3
         self.assertDictEqual(
             response_json,
             {
-                "country": [{
-                    "user_message": REQUIRED_FIELD_COUNTRY_MSG,
+                "username": [{
+                    "user_message": AUTHN_USERNAME_CONFLICT_MSG,
                 }],
-                "error_code": "invalid-country"
+                "email": [{
+                    "user_message": AUTHN_EMAIL_CONFLICT_MSG,
+                }],
+                "error_code": "duplicate-email-username"
             }
         )
 
@@ -514,6 +426,13 @@ class RegistrationViewTestV1(
     CITY = "Springfield"
     COUNTRY = "US"
     GOALS = "Learn all the things!"
+    BASE_VALID_DATA = {
+        "email": EMAIL,
+        "name": NAME,
+        "username": USERNAME,
+        "password": PASSWORD,
+    }
+    BASE_VALID_DATA_WITH_COUNTRY = dict(BASE_VALID_DATA, country=COUNTRY)
     PROFESSION_OPTIONS = [
         {
             "name": '--',
@@ -560,7 +479,61 @@ class RegistrationViewTestV1(
             "default": False
         }
     ]
-    link_template = "<a href='/honor' rel='noopener' target='_blank'>{link_label}</a>"
+    EXPECTED_PROFESSION_TEXT_FIELD = {
+        "name": "profession",
+        "type": "text",
+        "required": True,
+        "label": "Profession",
+        "errorMessages": {
+            "required": "Enter your profession"
+        }
+    }
+    EXPECTED_SPECIALTY_TEXT_FIELD = {
+        "name": "specialty",
+        "type": "text",
+        "required": True,
+        "label": "Specialty",
+        "errorMessages": {
+            "required": "Enter your specialty"
+        }
+    }
+    EXPECTED_MAILING_ADDRESS_FIELD = {
+        "name": "mailing_address",
+        "type": "textarea",
+        "required": False,
+        "label": "Mailing address",
+        "errorMessages": {
+            "required": "Enter your mailing address"
+        }
+    }
+    EXPECTED_CITY_FIELD = {
+        "name": "city",
+        "type": "text",
+        "required": False,
+        "label": "City",
+        "errorMessages": {
+            "required": "Enter your city"
+        }
+    }
+    EXPECTED_STATE_FIELD = {
+        "name": "state",
+        "type": "text",
+        "required": False,
+        "label": "State/Province/Region",
+    }
+    link_template = "<a href='{url}' rel='noopener' target='_blank'>{link_label}</a>"
+    combined_honor_code_label_template = (
+        "By creating an account, you agree to the {spacing}"
+        "{link_label} {spacing}"
+        "and you acknowledge that {platform_name} and each Member process your "
+        "personal data in accordance {spacing}"
+        "with the {link_label2}."
+    )
+    agreement_label_template = "I agree to the {platform_name} {link_label}"
+    agreement_error_template = "You must agree to the {platform_name} {link_label}"
+    activation_subject_template = "Action Required: Activate your {platform_name} account"
+    activation_body_template = "high-quality {platform_name} courses"
+    request_factory = RequestFactory()
 
     @classmethod
     def setUpClass(cls):
@@ -572,10 +545,7 @@ class RegistrationViewTestV1(
         """
         super().setUpClass()
         cls.start_events_isolation()
-
-    def setUp(self):  # pylint: disable=arguments-differ
-        super().setUp()
-        self.url = reverse("user_api_registration")
+        cls.url = reverse("user_api_registration")
 
     @ddt.data("get", "post")
     def test_auth_disabled(self, method):
@@ -598,6 +568,7 @@ class RegistrationViewTestV1(
 
     def test_register_form_default_fields(self):
         no_extra_fields_setting = {}
+        reg_fields = self._get_reg_fields(no_extra_fields_setting)
 
         self._assert_reg_field(
             no_extra_fields_setting,
@@ -611,7 +582,8 @@ class RegistrationViewTestV1(
                     "min_length": EMAIL_MIN_LENGTH,
                     "max_length": EMAIL_MAX_LENGTH
                 },
-            }
+            },
+            reg_fields,
         )
 
         self._assert_reg_field(
@@ -625,7 +597,8 @@ class RegistrationViewTestV1(
                 "restrictions": {
                     "max_length": 255
                 },
-            }
+            },
+            reg_fields,
         )
 
         self._assert_reg_field(
@@ -640,7 +613,8 @@ class RegistrationViewTestV1(
                     "min_length": USERNAME_MIN_LENGTH,
                     "max_length": USERNAME_MAX_LENGTH
                 },
-            }
+            },
+            reg_fields,
         )
 
         self._assert_reg_field(
@@ -653,7 +627,8 @@ class RegistrationViewTestV1(
                 "label": "Password",
                 "instructions": password_validators_instruction_texts(),
                 "restrictions": password_validators_restrictions(),
-            }
+            },
+            reg_fields,
         )
 
     @override_settings(AUTH_PASSWORD_VALIDATORS=[
@@ -669,6 +644,10 @@ class RegistrationViewTestV1(
     ])
     def test_register_form_password_complexity(self):
         no_extra_fields_setting = {}
+        # The validators are fixed for the duration of this test, so the
+        # expected restrictions only need to be computed once.
+        restrictions = password_validators_restrictions()
+        reg_fields = self._get_reg_fields(no_extra_fields_setting)
 
         # Without enabling password policy
         self._assert_reg_field(
@@ -677,8 +656,9 @@ class RegistrationViewTestV1(
                 'name': 'password',
                 'label': 'Password',
                 "instructions": password_validators_instruction_texts(),
-                "restrictions": password_validators_restrictions(),
-            }
+                "restrictions": restrictions,
+            },
+            reg_fields,
         )
 
         msg = 'Your password must contain at least 2 characters, including ' \
@@ -689,13 +669,15 @@ class RegistrationViewTestV1(
                 'name': 'password',
                 'label': 'Password',
                 'instructions': msg,
-                "restrictions": password_validators_restrictions(),
-            }
+                "restrictions": restrictions,
+            },
+            reg_fields,
         )
 
     @override_settings(REGISTRATION_EXTENSION_FORM='openedx.core.djangoapps.user_api.tests.test_helpers.TestCaseForm')
     def test_extension_form_fields(self):
         no_extra_fields_setting = {}
+        reg_fields = self._get_reg_fields(no_extra_fields_setting)
 
         # Verify other fields didn't disappear for some reason.
         self._assert_reg_field(
@@ -710,7 +692,8 @@ class RegistrationViewTestV1(
                     "min_length": EMAIL_MIN_LENGTH,
                     "max_length": EMAIL_MAX_LENGTH
                 },
-            }
+            },
+            reg_fields,
         )
 
         self._assert_reg_absent_field(
@@ -746,7 +729,8 @@ class RegistrationViewTestV1(
                     "min_length": TestCaseForm.MOVIE_MIN_LEN,
                     "max_length": TestCaseForm.MOVIE_MAX_LEN,
                 }
-            }
+            },
+            reg_fields,
         )
 
     @ddt.data(
@@ -760,22 +744,11 @@ class RegistrationViewTestV1(
     def test_register_form_third_party_auth_running_google(self, input_country_code, expected_country_code,
                                                            input_username, expected_username):
         no_extra_fields_setting = {}
-        country_options = (
-            [
-                {
-                    "name": "--",
-                    "value": "",
-                    "default": False
-                }
-            ] + [
-                {
-                    "value": country_code,
-                    "name": str(country_name),
-                    "default": country_code == expected_country_code
-                }
-                for country_code, country_name in SORTED_COUNTRIES
-            ]
-        )
+        country_options = [{"name": "--", "value": "", "default": False}] + COUNTRY_OPTIONS
+        # Only the expected country is marked as the default, so copy just that option.
+        # The offset accounts for the leading "--" option.
+        index = COUNTRY_OPTION_INDEX[expected_country_code] + 1
+        country_options[index] = dict(country_options[index], default=True)
 
         provider = self.configure_google_provider(enabled=True)
         with simulate_running_pipeline(
@@ -785,8 +758,9 @@ class RegistrationViewTestV1(
             username=input_username,
             country=input_country_code
         ):
-            self._assert_password_field_hidden(no_extra_fields_setting)
-            self._assert_social_auth_provider_present(no_extra_fields_setting, provider)
+            reg_fields = self._get_reg_fields(no_extra_fields_setting)
+            self._assert_password_field_hidden(no_extra_fields_setting, reg_fields)
+            self._assert_social_auth_provider_present(no_extra_fields_setting, provider, reg_fields)
 
             # Email should be filled in
             self._assert_reg_field(
@@ -802,7 +776,8 @@ class RegistrationViewTestV1(
                         "min_length": EMAIL_MIN_LENGTH,
                         "max_length": EMAIL_MAX_LENGTH
                     },
-                }
+                },
+                reg_fields,
             )
 
             # Full Name should be filled in
@@ -818,7 +793,8 @@ class RegistrationViewTestV1(
                     "restrictions": {
                         "max_length": NAME_MAX_LENGTH,
                     }
-                }
+                },
+                reg_fields,
             )
 
             # Username should be filled in
@@ -835,7 +811,8 @@ class RegistrationViewTestV1(
                         "min_length": USERNAME_MIN_LENGTH,
                         "max_length": USERNAME_MAX_LENGTH
                     }
-                }
+                },
+                reg_fields,
             )
 
             # Country should be filled in.
@@ -948,23 +925,6 @@ class RegistrationViewTestV1(
         )
 
     def test_register_form_year_of_birth(self):
-        this_year = datetime.now(UTC).year
-        year_options = (
-            [
-                {
-                    "value": "",
-                    "name": "--",
-                    "default": True
-                }
-            ] + [
-                {
-                    "value": str(year),
-                    "name": str(year),
-                    "default": False
-                }
-                for year in range(this_year, this_year - 120, -1)
-            ]
-        )
         self._assert_reg_field(
             {"year_of_birth": "optional"},
             {
@@ -972,7 +932,7 @@ class RegistrationViewTestV1(
                 "type": "select",
                 "required": False,
                 "label": "Year of birth",
-                "options": year_options,
+                "options": YEAR_OF_BIRTH_OPTIONS,
             }
         )
 
@@ -984,27 +944,16 @@ class RegistrationViewTestV1(
                 "type": "checkbox",
                 "required": False,
                 "label": 'I agree that {platform_name} may send me marketing messages.'.format(
-                    platform_name=settings.PLATFORM_NAME,
-                ),
-                "exposed": True,
-                "defaultValue": True,
-            }
-        )
-
-    def test_register_form_profession_without_profession_options(self):
-        self._assert_reg_field(
-            {"profession": "required"},
-            {
-                "name": "profession",
-                "type": "text",
-                "required": True,
-                "label": "Profession",
-                "errorMessages": {
-                    "required": "Enter your profession"
-                }
+                    platform_name=settings.PLATFORM_NAME,
+                ),
+                "exposed": True,
+                "defaultValue": True,
             }
         )
 
+    def test_register_form_profession_without_profession_options(self):
+        self._assert_reg_field({"profession": "required"}, self.EXPECTED_PROFESSION_TEXT_FIELD)
+
     @with_site_configuration(
         configuration={
             "EXTRA_FIELD_OPTIONS": {"profession": ["Software Engineer", "Teacher", "Other"]}
@@ -1026,18 +975,7 @@ class RegistrationViewTestV1(
         )
 
     def test_register_form_specialty_without_specialty_options(self):
-        self._assert_reg_field(
-            {"specialty": "required"},
-            {
-                "name": "specialty",
-                "type": "text",
-                "required": True,
-                "label": "Specialty",
-                "errorMessages": {
-                    "required": "Enter your specialty"
-                }
-            }
-        )
+        self._assert_reg_field({"specialty": "required"}, self.EXPECTED_SPECIALTY_TEXT_FIELD)
 
     @with_site_configuration(
         configuration={
@@ -1060,18 +998,7 @@ class RegistrationViewTestV1(
         )
 
     def test_registration_form_mailing_address(self):
-        self._assert_reg_field(
-            {"mailing_address": "optional"},
-            {
-                "name": "mailing_address",
-                "type": "textarea",
-                "required": False,
-                "label": "Mailing address",
-                "errorMessages": {
-                    "required": "Enter your mailing address"
-                }
-            }
-        )
+        self._assert_reg_field({"mailing_address": "optional"}, self.EXPECTED_MAILING_ADDRESS_FIELD)
 
     def test_registration_form_goals(self):
         self._assert_reg_field(
@@ -1090,47 +1017,13 @@ class RegistrationViewTestV1(
         )
 
     def test_registration_form_city(self):
-        self._assert_reg_field(
-            {"city": "optional"},
-            {
-                "name": "city",
-                "type": "text",
-                "required": False,
-                "label": "City",
-                "errorMessages": {
-                    "required": "Enter your city"
-                }
-            }
-        )
+        self._assert_reg_field({"city": "optional"}, self.EXPECTED_CITY_FIELD)
 
     def test_registration_form_state(self):
-        self._assert_reg_field(
-            {"state": "optional"},
-            {
-                "name": "state",
-                "type": "text",
-                "required": False,
-                "label": "State/Province/Region",
-            }
-        )
+        self._assert_reg_field({"state": "optional"}, self.EXPECTED_STATE_FIELD)
 
     def test_registration_form_country(self):
-        country_options = (
-            [
-                {
-                    "name": "--",
-                    "value": "",
-                    "default": True
-                }
-            ] + [
-                {
-                    "value": country_code,
-                    "name": str(country_name),
-                    "default": False
-                }
-                for country_code, country_name in SORTED_COUNTRIES
-            ]
-        )
+        country_options = [{"name": "--", "value": "", "default": True}] + COUNTRY_OPTIONS
         self._assert_reg_field(
             {"country": "required"},
             {
@@ -1149,173 +1042,87 @@ class RegistrationViewTestV1(
     def test_registration_form_confirm_email(self):
         pass
 
-    @override_settings(
-        MKTG_URLS={"ROOT": "https://www.test.com/", "HONOR": "honor"},
+    @ddt.data(
+        (
+            True,
+            {"MKTG_URLS": {"ROOT": "https://www.test.com/", "HONOR": "honor"}},
+            "https://www.test.com/honor",
+            "#",
+        ),
+        (False, {"MKTG_URLS_LINK_MAP": {"HONOR": "honor"}}, "/honor", "/privacy"),
     )
-    @mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": True})
-    def test_registration_honor_code_mktg_site_enabled(self):
-        link_template = "<a href='https://www.test.com/honor' rel='noopener' target='_blank'>{link_label}</a>"
-        link_template2 = "<a href='#' rel='noopener' target='_blank'>{link_label}</a>"
-        link_label = "Terms of Service and Honor Code"
-        link_label2 = "Privacy Policy"
-        self._assert_reg_field(
-            {"honor_code": "required"},
-            {
-                "label": ("By creating an account, you agree to the {spacing}"
-                          "{link_label} {spacing}"
-                          "and you acknowledge that {platform_name} and each Member process your "
-                          "personal data in accordance {spacing}"
-                          "with the {link_label2}.").format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=link_template.format(link_label=link_label),
-                    link_label2=link_template2.format(link_label=link_label2),
-                    spacing=' ' * 18
-                ),
-                "name": "honor_code",
-                "defaultValue": False,
-                "type": "plaintext",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} {link_label}".format(
-                        platform_name=settings.PLATFORM_NAME,
-                        link_label=link_label
-                    )
-                }
-            }
-        )
-
-    @override_settings(MKTG_URLS_LINK_MAP={"HONOR": "honor"})
-    @mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": False})
-    def test_registration_honor_code_mktg_site_disabled(self):
-        link_template = "<a href='/privacy' rel='noopener' target='_blank'>{link_label}</a>"
+    @ddt.unpack
+    def test_registration_honor_code(self, mktg_site_enabled, url_settings, honor_url, privacy_url):
+        platform_name = settings.PLATFORM_NAME
         link_label = "Terms of Service and Honor Code"
         link_label2 = "Privacy Policy"
-        self._assert_reg_field(
-            {"honor_code": "required"},
-            {
-                "label": ("By creating an account, you agree to the {spacing}"
-                          "{link_label} {spacing}"
-                          "and you acknowledge that {platform_name} and each Member process your "
-                          "personal data in accordance {spacing}"
-                          "with the {link_label2}.").format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=self.link_template.format(link_label=link_label),
-                    link_label2=link_template.format(link_label=link_label2),
-                    spacing=' ' * 18
-                ),
-                "name": "honor_code",
-                "defaultValue": False,
-                "type": "plaintext",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} {link_label}".format(
-                        platform_name=settings.PLATFORM_NAME,
-                        link_label=link_label
-                    )
-                }
-            }
-        )
-
-    @override_settings(MKTG_URLS={
-        "ROOT": "https://www.test.com/",
-        "HONOR": "honor",
-        "TOS": "tos",
-    })
-    @mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": True})
-    def test_registration_separate_terms_of_service_mktg_site_enabled(self):
-        # Honor code field should say ONLY honor code,
-        # not "terms of service and honor code"
-        link_label = 'Honor Code'
-        link_template = "<a href='https://www.test.com/honor' rel='noopener' target='_blank'>{link_label}</a>"
-        self._assert_reg_field(
-            {"honor_code": "required", "terms_of_service": "required"},
-            {
-                "label": "I agree to the {platform_name} {link_label}".format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=link_template.format(link_label=link_label)
-                ),
-                "name": "honor_code",
-                "defaultValue": False,
-                "type": "checkbox",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} {link_label}".format(
-                        platform_name=settings.PLATFORM_NAME,
-                        link_label=link_label
-                    )
+        with override_settings(**url_settings), \
+                mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": mktg_site_enabled}):
+            self._assert_reg_field(
+                {"honor_code": "required"},
+                {
+                    "label": self.combined_honor_code_label_template.format(
+                        platform_name=platform_name,
+                        link_label=self.link_template.format(url=honor_url, link_label=link_label),
+                        link_label2=self.link_template.format(url=privacy_url, link_label=link_label2),
+                        spacing=' ' * 18
+                    ),
+                    "name": "honor_code",
+                    "defaultValue": False,
+                    "type": "plaintext",
+                    "required": True,
+                    "errorMessages": {
+                        "required": self.agreement_error_template.format(
+                            platform_name=platform_name,
+                            link_label=link_label
+                        )
+                    }
                 }
-            }
-        )
+            )
 
-        # Terms of service field should also be present
-        link_label = "Terms of Service"
-        link_template = "<a href='https://www.test.com/tos' rel='noopener' target='_blank'>{link_label}</a>"
-        self._assert_reg_field(
-            {"honor_code": "required", "terms_of_service": "required"},
-            {
-                "label": "I agree to the {platform_name} {link_label}".format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=link_template.format(link_label=link_label)
-                ),
-                "name": "terms_of_service",
-                "defaultValue": False,
-                "type": "checkbox",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} {link_label}".format(
-                        platform_name=settings.PLATFORM_NAME,
-                        link_label=link_label
-                    )
-                }
-            }
-        )
+    @ddt.data(
+        (
+            True,
+            {"MKTG_URLS": {"ROOT": "https://www.test.com/", "HONOR": "honor", "TOS": "tos"}},
+            "https://www.test.com/",
+        ),
+        (False, {"MKTG_URLS_LINK_MAP": {"HONOR": "honor", "TOS": "tos"}}, "/"),
+    )
+    @ddt.unpack
+    def test_registration_separate_terms_of_service(self, mktg_site_enabled, url_settings, url_root):
+        platform_name = settings.PLATFORM_NAME
+        field_settings = {"honor_code": "required", "terms_of_service": "required"}
+        with override_settings(**url_settings), \
+                mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": mktg_site_enabled}):
+            reg_fields = self._get_reg_fields(field_settings)
 
-    @override_settings(MKTG_URLS_LINK_MAP={"HONOR": "honor", "TOS": "tos"})
-    @mock.patch.dict(settings.FEATURES, {"ENABLE_MKTG_SITE": False})
-    def test_registration_separate_terms_of_service_mktg_site_disabled(self):
         # Honor code field should say ONLY honor code,
-        # not "terms of service and honor code"
-        link_label = 'Honor Code'
-        self._assert_reg_field(
-            {"honor_code": "required", "terms_of_service": "required"},
-            {
-                "label": "I agree to the {platform_name} {link_label}".format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=self.link_template.format(link_label=link_label)
-                ),
-                "name": "honor_code",
-                "defaultValue": False,
-                "type": "checkbox",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} Honor Code".format(
-                        platform_name=settings.PLATFORM_NAME
-                    )
-                }
-            }
-        )
-
-        link_label = 'Terms of Service'
-        # Terms of service field should also be present
-        link_template = "<a href='/tos' rel='noopener' target='_blank'>{link_label}</a>"
-        self._assert_reg_field(
-            {"honor_code": "required", "terms_of_service": "required"},
-            {
-                "label": "I agree to the {platform_name} {link_label}".format(
-                    platform_name=settings.PLATFORM_NAME,
-                    link_label=link_template.format(link_label=link_label)
-                ),
-                "name": "terms_of_service",
-                "defaultValue": False,
-                "type": "checkbox",
-                "required": True,
-                "errorMessages": {
-                    "required": "You must agree to the {platform_name} Terms of Service".format(
-                        platform_name=settings.PLATFORM_NAME
-                    )
-                }
-            }
-        )
+        # not "terms of service and honor code".
+        # Terms of service field should also be present.
+        for name, link_label, path in (
+            ("honor_code", "Honor Code", "honor"),
+            ("terms_of_service", "Terms of Service", "tos"),
+        ):
+            self._assert_reg_field(
+                field_settings,
+                {
+                    "label": self.agreement_label_template.format(
+                        platform_name=platform_name,
+                        link_label=self.link_template.format(url=url_root + path, link_label=link_label)
+                    ),
+                    "name": name,
+                    "defaultValue": False,
+                    "type": "checkbox",
+                    "required": True,
+                    "errorMessages": {
+                        "required": self.agreement_error_template.format(
+                            platform_name=platform_name,
+                            link_label=link_label
+                        )
+                    }
+                },
+                reg_fields
+            )
 
     @override_settings(
         REGISTRATION_EXTRA_FIELDS={
@@ -1333,13 +1140,10 @@ class RegistrationViewTestV1(
         REGISTRATION_FIELD_ORDER=None,
         REGISTRATION_EXTENSION_FORM='openedx.core.djangoapps.user_api.tests.test_helpers.TestCaseForm',
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
         assert field_names == [
             "email",
             "name",
@@ -1395,13 +1199,10 @@ class RegistrationViewTestV1(
             "profession",
         ],
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order_override(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
         assert field_names == ['name', 'username', 'email', 'password', 'city', 'state', 'country', 'gender',
                                'year_of_birth', 'level_of_education', 'mailing_address', 'goals', 'honor_code']
 
@@ -1436,13 +1237,10 @@ class RegistrationViewTestV1(
             "terms_of_service",
         ],
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order_invalid_override(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
 
         assert field_names == [
             "name",
@@ -1474,15 +1272,10 @@ class RegistrationViewTestV1(
         assert settings.EDXMKTG_LOGGED_IN_COOKIE_NAME in self.client.cookies
         assert settings.EDXMKTG_USER_INFO_COOKIE_NAME in self.client.cookies
 
-        user = User.objects.get(username=self.USERNAME)
-        request = RequestFactory().get('/url')
-        request.user = user
-        account_settings = get_account_settings(request)[0]
-
-        assert self.USERNAME == account_settings["username"]
-        assert self.EMAIL == account_settings["email"]
-        assert not account_settings["is_active"]
-        assert self.NAME == account_settings["name"]
+        user = User.objects.select_related('profile').get(username=self.USERNAME)
+        assert self.EMAIL == user.email
+        assert not user.is_active
+        assert self.NAME == user.profile.name
 
         # Verify that we've been logged in
         # by trying to access a page that requires authentication
@@ -1515,7 +1308,7 @@ class RegistrationViewTestV1(
 
         # Verify the user's account
         user = User.objects.get(username=self.USERNAME)
-        request = RequestFactory().get('/url')
+        request = self.request_factory.get('/url')
         request.user = user
         account_settings = get_account_settings(request)[0]
 
@@ -1549,7 +1342,7 @@ class RegistrationViewTestV1(
         assert settings.EDXMKTG_USER_INFO_COOKIE_NAME in self.client.cookies
 
         user = User.objects.get(username=self.USERNAME)
-        request = RequestFactory().get('/url')
+        request = self.request_factory.get('/url')
         request.user = user
         account_settings = get_account_settings(request)[0]
 
@@ -1567,6 +1360,8 @@ class RegistrationViewTestV1(
         self.assertHttpOK(response)
 
     def test_activation_email(self):
+        platform_name = settings.PLATFORM_NAME
+
         # Register, which should trigger an activation email
         response = self.client.post(self.url, {
             "email": self.EMAIL,
@@ -1581,9 +1376,8 @@ class RegistrationViewTestV1(
         assert len(mail.outbox) == 1
         sent_email = mail.outbox[0]
         assert sent_email.to == [self.EMAIL]
-        assert sent_email.subject == \
-               f'Action Required: Activate your {settings.PLATFORM_NAME} account'
-        assert f'high-quality {settings.PLATFORM_NAME} courses' in sent_email.body
+        assert sent_email.subject == self.activation_subject_template.format(platform_name=platform_name)
+        assert self.activation_body_template.format(platform_name=platform_name) in sent_email.body
 
     @ddt.data(
         {"email": ""},
@@ -1594,16 +1388,8 @@ class RegistrationViewTestV1(
         {"password": ""},
     )
     def test_register_invalid_input(self, invalid_fields):
-        # Initially, the field values are all valid
-        data = {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-        }
-
         # Override the valid fields, making the input invalid
-        data.update(invalid_fields)
+        data = {**self.BASE_VALID_DATA, **invalid_fields}
 
         # Attempt to create the account, expecting an error response
         response = self.client.post(self.url, data)
@@ -1612,15 +1398,10 @@ class RegistrationViewTestV1(
     @ddt.data("email", "name", "username", "password", "country")
     def test_register_missing_required_field(self, missing_field):
         data = {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "country": self.COUNTRY,
+            key: value for key, value in self.BASE_VALID_DATA_WITH_COUNTRY.items()
+            if key != missing_field
         }
 
-        del data[missing_field]
-
         # Send a request missing a field
         response = self.client.post(self.url, data)
         self.assertHttpBadRequest(response)
@@ -1637,7 +1418,7 @@ class RegistrationViewTestV1(
         del data['country']
 
         response = self.client.post(self.url, data)
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
 
         self.assertHttpBadRequest(response)
         self.assertDictEqual(
@@ -1661,7 +1442,7 @@ class RegistrationViewTestV1(
         }
 
         response = self.client.post(self.url, data)
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
 
         self.assertHttpBadRequest(response)
         self.assertDictEqual(
@@ -1675,15 +1456,8 @@ class RegistrationViewTestV1(
         )
 
     def test_register_duplicate_email(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+        # Create the first user directly; only the second registration is under test
+        UserFactory(username=self.USERNAME, email=self.EMAIL)
 
         # Try to create a second user with the same email address
         response = self.client.post(self.url, {
@@ -1695,7 +1469,7 @@ class RegistrationViewTestV1(
         })
 
         assert response.status_code == 409
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -1707,15 +1481,8 @@ class RegistrationViewTestV1(
         )
 
     def test_register_duplicate_username(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+        # Create the first user directly; only the second registration is under test
+        UserFactory(username=self.USERNAME, email=self.EMAIL)
 
         # Try to create a second user with the same username
         response = self.client.post(self.url, {
@@ -1727,7 +1494,7 @@ class RegistrationViewTestV1(
         })
 
         assert response.status_code == 409
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         username_suggestions = response_json.pop('username_suggestions')
         assert len(username_suggestions) == 3
         self.assertDictEqual(
@@ -1741,15 +1508,8 @@ class RegistrationViewTestV1(
         )
 
     def test_register_duplicate_username_and_email(self):
-        # Register the first user
-        response = self.client.post(self.url, {
-            "email": self.EMAIL,
-            "name": self.NAME,
-            "username": self.USERNAME,
-            "password": self.PASSWORD,
-            "honor_code": "true",
-        })
-        self.assertHttpOK(response)
+        # Create the first user directly; only the second registration is under test
+        UserFactory(username=self.USERNAME, email=self.EMAIL)
 
         # Try to create a second user with the same username
         response = self.client.post(self.url, {
@@ -1761,7 +1521,7 @@ class RegistrationViewTestV1(
         })
 
         assert response.status_code == 409
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         username_suggestions = response_json.pop('username_suggestions')
         assert len(username_suggestions) == 3
         self.assertDictEqual(
@@ -1797,7 +1557,7 @@ class RegistrationViewTestV1(
             }
         )
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -1809,12 +1569,10 @@ class RegistrationViewTestV1(
 
     def test_country_overrides(self):
         """Test that overridden countries are available in country list."""
-        # Retrieve the registration form description
-        with override_settings(REGISTRATION_EXTRA_FIELDS={"country": "required"}):
-            response = self.client.get(self.url)
-            self.assertHttpOK(response)
+        reg_fields = self._get_reg_fields({"country": "required"})
 
-        self.assertContains(response, 'Kosovo')
+        country_names = [option["name"] for option in reg_fields["country"]["options"]]
+        assert 'Kosovo' in country_names
 
     def test_password_with_spaces(self):
         """Test that spaces are stripped correctly from password while creating an account."""
@@ -1851,8 +1609,10 @@ class RegistrationViewTestV1(
             else:
                 return get_value(value, default)
 
-        with mock.patch('openedx.core.djangoapps.site_configuration.helpers.get_value') as mock_get_value:
-            mock_get_value.side_effect = _side_effect_for_get_value
+        with mock.patch(
+            'openedx.core.djangoapps.site_configuration.helpers.get_value',
+            side_effect=_side_effect_for_get_value,
+        ):
             response = self.client.post(self.url, {"email": self.EMAIL, "username": self.USERNAME})
             assert response.status_code == 403
 
@@ -1907,7 +1667,7 @@ class RegistrationViewTestV1(
         self.assertHttpOK(response)
 
         user = User.objects.get(email=self.EMAIL)
-        request = RequestFactory().get('/url')
+        request = self.request_factory.get('/url')
         request.user = user
         account_settings = get_account_settings(request)[0]
 
@@ -1935,7 +1695,7 @@ class RegistrationViewTestV1(
             "honor_code": "true",
         })
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -1987,7 +1747,7 @@ class RegistrationViewTestV1(
         })
 
         assert response.status_code == 409
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         response_json.pop('username_suggestions')
         self.assertDictEqual(
             response_json,
@@ -2005,29 +1765,48 @@ class RegistrationViewTestV1(
         """
         assert actual_field is not None, "Could not find field {name}".format(name=expected_field["name"])
 
-        for key in expected_field:
-            assert actual_field[key] == expected_field[key], \
-                "Expected {expected} for {key} but got {actual} instead".format(
-                    key=key, actual=actual_field[key], expected=expected_field[key])
+        # Only compare the keys we expect; the form may describe the field in more detail.
+        actual_subset = {key: actual_field.get(key) for key in expected_field}
+        self.assertEqual(actual_subset, expected_field)
 
     def _populate_always_present_fields(self, field):
         """
         Populate field dictionary with keys and values that are always present.
         """
-        defaults = [
-            ("label", ""),
-            ("instructions", ""),
-            ("placeholder", ""),
-            ("defaultValue", ""),
-            ("restrictions", {}),
-            ("errorMessages", {}),
-        ]
-        field.update({
-            key: value
-            for key, value in defaults if key not in field
-        })
+        for key, value in _DEFAULT_FIELD.items():
+            field.setdefault(key, value)
+
+    def _get_field_names(self):
+        """
+        Retrieve the registration form description from the server and
+        return the names of its fields, in the order they are rendered.
+        """
+        response = self.client.get(self.url)
+        self.assertHttpOK(response)
+
+        form_desc = response.json()
+        return [field["name"] for field in form_desc["fields"]]
+
+    def _get_reg_fields(self, extra_fields_setting):
+        """
+        Retrieve the registration form description from the server and
+        return its fields keyed by name.
+
+        Args:
+            extra_fields_setting (dict): Override the Django setting controlling
+                which extra fields are displayed in the form.
+
+        Returns:
+            dict
+        """
+        with override_settings(REGISTRATION_EXTRA_FIELDS=extra_fields_setting):
+            response = self.client.get(self.url)
+            self.assertHttpOK(response)
 
-    def _assert_reg_field(self, extra_fields_setting, expected_field):
+        form_desc = response.json()
+        return {field["name"]: field for field in form_desc["fields"]}
+
+    def _assert_reg_field(self, extra_fields_setting, expected_field, reg_fields=None):
         """
         Retrieve the registration form description from the server and
         verify that it contains the expected field.
@@ -2036,28 +1815,22 @@ class RegistrationViewTestV1(
             extra_fields_setting (dict): Override the Django setting controlling
                 which extra fields are displayed in the form.
             expected_field (dict): The field definition we expect to find in the form.
+            reg_fields (dict): Optional fields returned by `_get_reg_fields` for the
+                same settings, to avoid fetching the form again.
 
         Raises:
             AssertionError
         """
-        # Add in fields that are always present
+        # Add in fields that are always present, without modifying the caller's
+        # dict, since it may be a class-level constant shared between tests.
+        expected_field = dict(expected_field)
         self._populate_always_present_fields(expected_field)
 
-        # Retrieve the registration form description
-        with override_settings(REGISTRATION_EXTRA_FIELDS=extra_fields_setting):
-            response = self.client.get(self.url)
-            self.assertHttpOK(response)
+        if reg_fields is None:
+            reg_fields = self._get_reg_fields(extra_fields_setting)
 
         # Verify that the form description matches what we'd expect
-        form_desc = json.loads(response.content.decode('utf-8'))
-
-        actual_field = None
-        for field in form_desc["fields"]:
-            if field["name"] == expected_field["name"]:
-                actual_field = field
-                break
-
-        self._assert_fields_match(actual_field, expected_field)
+        self._assert_fields_match(reg_fields.get(expected_field["name"]), expected_field)
 
     def _assert_reg_absent_field(self, extra_fields_setting, expected_absent_field: str):
         """
@@ -2078,26 +1851,26 @@ class RegistrationViewTestV1(
             self.assertHttpOK(response)
 
         # Verify that the form description matches what we'd expect
-        form_desc = json.loads(response.content.decode('utf-8'))
+        form_desc = response.json()
 
         current_present_field_names = [field["name"] for field in form_desc["fields"]]
         assert expected_absent_field not in current_present_field_names, \
             "Expected absent field {expected}".format(expected=expected_absent_field)
 
-    def _assert_password_field_hidden(self, field_settings):
+    def _assert_password_field_hidden(self, field_settings, reg_fields=None):
         self._assert_reg_field(field_settings, {
             "name": "password",
             "type": "hidden",
             "required": False
-        })
+        }, reg_fields)
 
-    def _assert_social_auth_provider_present(self, field_settings, backend):
+    def _assert_social_auth_provider_present(self, field_settings, backend, reg_fields=None):
         self._assert_reg_field(field_settings, {
             "name": "social_auth_provider",
             "type": "hidden",
             "required": False,
             "defaultValue": backend.name
-        })
+        }, reg_fields)
 
 
 @ddt.ddt
@@ -2118,10 +1891,7 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
         """
         super().setUpClass()
         cls.start_events_isolation()
-
-    def setUp(self):  # pylint: disable=arguments-differ
-        super(RegistrationViewTestV1, self).setUp()  # lint-amnesty, pylint: disable=bad-super-call
-        self.url = reverse("user_api_registration_v2")
+        cls.url = reverse("user_api_registration_v2")
 
     @override_settings(
         REGISTRATION_EXTRA_FIELDS={
@@ -2154,13 +1924,10 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
             "terms_of_service",
         ],
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order_invalid_override(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
 
         assert field_names == [
             "name",
@@ -2218,13 +1985,10 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
             "profession",
         ],
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order_override(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
         assert field_names == ['name', 'username', 'email', 'confirm_email',
                                'password', 'city', 'state', 'country',
                                'gender', 'year_of_birth', 'level_of_education',
@@ -2246,13 +2010,10 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
         REGISTRATION_FIELD_ORDER=None,
         REGISTRATION_EXTENSION_FORM='openedx.core.djangoapps.user_api.tests.test_helpers.TestCaseForm',
     )
+    @mock.patch(REGISTRATION_FORM_COUNTRIES, FIELD_ORDER_COUNTRIES)
     def test_field_order(self):
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
         assert field_names == [
             "email",
             "name",
@@ -2293,12 +2054,8 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
         Test that year of birth is not returned when ENABLE_COPPA_COMPLIANCE is
         set to True.
         """
-        response = self.client.get(self.url)
-        self.assertHttpOK(response)
-
         # Verify that all fields render in the correct order
-        form_desc = json.loads(response.content.decode('utf-8'))
-        field_names = [field["name"] for field in form_desc["fields"]]
+        field_names = self._get_field_names()
         assert field_names == [
             "email",
             "name",
@@ -2337,7 +2094,7 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
         Assumes that response content is well-formed JSON
         (you can call `_assert_response` first to assert this).
         """
-        response_dict = json.loads(response.content.decode('utf-8'))
+        response_dict = response.json()
         assert 'redirect_url' in response_dict, (
             "Response JSON unexpectedly does not have redirect_url: {!r}".format(
                 response_dict
@@ -2425,7 +2182,7 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
 
         # Check that authenticated user details are also returned in
         # the response for successful registration
-        decoded_response = json.loads(response.content.decode('utf-8'))
+        decoded_response = response.json()
         assert decoded_response['authenticated_user'] == expected_response
 
     @mock.patch('openedx.core.djangoapps.user_authn.views.register._record_is_marketable_attribute')
@@ -2507,7 +2264,7 @@ class RegistrationViewTestV2(RegistrationViewTestV1):
             "country": "KP",
         })
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {'country':
@@ -2533,6 +2290,14 @@ class ThirdPartyRegistrationTestMixin(
 
     ENABLED_CACHES = ['default']
 
+    _DEFAULT_DATA = {
+        "honor_code": "true",
+        "country": "US",
+        "username": "test_username",
+        "name": "test name",
+        "email": "test@test.com",
+    }
+
     __test__ = False
 
     @classmethod
@@ -2545,32 +2310,36 @@ class ThirdPartyRegistrationTestMixin(
         """
         super().setUpClass()
         cls.start_events_isolation()
+        cls.url = reverse("user_api_registration")
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse('user_api_registration')
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the existing users that registration requests conflict with.
 
-    def tearDown(self):
-        super().tearDown()
-        Partial.objects.all().delete()
+        These users have no social auth link; tests that need one create it themselves,
+        since the other tests expect no UserSocialAuth records to exist.
+        """
+        super().setUpTestData()
+        cls.existing_user = UserFactory()
+        cls.inactive_user = UserFactory(is_active=False)
 
     def data(self, user=None):
         """Returns the request data for the endpoint."""
-        return {
+        data = {
+            **self._DEFAULT_DATA,
             "provider": self.BACKEND,
             "access_token": self.access_token,
             "client_id": self.client_id,
-            "honor_code": "true",
-            "country": "US",
-            "username": user.username if user else "test_username",
-            "name": user.first_name if user else "test name",
-            "email": user.email if user else "test@test.com"
         }
+        if user:
+            data.update(username=user.username, name=user.first_name, email=user.email)
+        return data
 
     def _assert_existing_user_error(self, response):
         """Assert that the given response was an error with the given status_code and error code."""
         assert response.status_code == 409
-        errors = json.loads(response.content.decode('utf-8'))
+        errors = response.json()
         for conflict_attribute in ["username", "email"]:
             if conflict_attribute == 'username':
                 error_message = AUTHN_USERNAME_CONFLICT_MSG
@@ -2582,7 +2351,7 @@ class ThirdPartyRegistrationTestMixin(
     def _assert_access_token_error(self, response, expected_error_message, error_code):
         """Assert that the given response was an error for the access_token field with the given error message."""
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -2594,7 +2363,7 @@ class ThirdPartyRegistrationTestMixin(
     def _assert_third_party_session_expired_error(self, response, expected_error_message):
         """Assert that given response is an error due to third party session expiry"""
         assert response.status_code == 400
-        response_json = json.loads(response.content.decode('utf-8'))
+        response_json = response.json()
         self.assertDictEqual(
             response_json,
             {
@@ -2605,14 +2374,16 @@ class ThirdPartyRegistrationTestMixin(
 
     def _verify_user_existence(self, user_exists, social_link_exists, user_is_active=None, username=None):
         """Verifies whether the user object exists."""
-        users = User.objects.filter(username=(username if username else "test_username"))
-        assert users.exists() == user_exists
+        user_row = User.objects.filter(
+            username=(username if username else "test_username")
+        ).annotate(
+            has_social_link=Exists(UserSocialAuth.objects.filter(user=OuterRef('pk'), provider=self.BACKEND))
+        ).values_list('is_active', 'has_social_link').first()
+        assert (user_row is not None) == user_exists
         if user_exists:
-            assert users[0].is_active == user_is_active
-            self.assertEqual(
-                UserSocialAuth.objects.filter(user=users[0], provider=self.BACKEND).exists(),
-                social_link_exists
-            )
+            is_active, has_social_link = user_row
+            assert is_active == user_is_active
+            assert has_social_link == social_link_exists
         else:
             assert UserSocialAuth.objects.count() == 0
 
@@ -2644,7 +2415,7 @@ class ThirdPartyRegistrationTestMixin(
         self._verify_user_existence(user_exists=False, social_link_exists=False, user_is_active=False)
 
     def test_unlinked_active_user(self):
-        user = UserFactory()
+        user = self.existing_user
         response = self.client.post(self.url, self.data(user))
         self._assert_existing_user_error(response)
         self._verify_user_existence(
@@ -2652,7 +2423,7 @@ class ThirdPartyRegistrationTestMixin(
         )
 
     def test_unlinked_inactive_user(self):
-        user = UserFactory(is_active=False)
+        user = self.inactive_user
         response = self.client.post(self.url, self.data(user))
         self._assert_existing_user_error(response)
         self._verify_user_existence(
@@ -2661,7 +2432,7 @@ class ThirdPartyRegistrationTestMixin(
 
     def test_user_already_registered(self):
         self._setup_provider_response(success=True)
-        user = UserFactory()
+        user = self.existing_user
         UserSocialAuth.objects.create(user=user, provider=self.BACKEND, uid=self.social_uid)
         response = self.client.post(self.url, self.data(user))
         self._assert_existing_user_error(response)
@@ -2671,7 +2442,7 @@ class ThirdPartyRegistrationTestMixin(
 
     def test_social_user_conflict(self):
         self._setup_provider_response(success=True)
-        user = UserFactory()
+        user = self.existing_user
         UserSocialAuth.objects.create(user=user, provider=self.BACKEND, uid=self.social_uid)
         response = self.client.post(self.url, self.data())
         self._assert_access_token_error(
@@ -2724,7 +2495,7 @@ class ThirdPartyRegistrationTestMixin(
 
 @skipUnless(settings.FEATURES.get("ENABLE_THIRD_PARTY_AUTH"), "third party auth not enabled")
 class TestFacebookRegistrationView(
-    ThirdPartyRegistrationTestMixin, ThirdPartyOAuthTestMixinFacebook, TransactionTestCase, OpenEdxEventsTestMixin
+    ThirdPartyRegistrationTestMixin, ThirdPartyOAuthTestMixinFacebook, OpenEdxEventsTestMixin
 ):
     """Tests the User API registration endpoint with Facebook authentication."""
 
@@ -2756,7 +2527,7 @@ class TestFacebookRegistrationView(
 
 @skipUnless(settings.FEATURES.get("ENABLE_THIRD_PARTY_AUTH"), "third party auth not enabled")
 class TestGoogleRegistrationView(
-    ThirdPartyRegistrationTestMixin, ThirdPartyOAuthTestMixinGoogle, TransactionTestCase, OpenEdxEventsTestMixin
+    ThirdPartyRegistrationTestMixin, ThirdPartyOAuthTestMixinGoogle, OpenEdxEventsTestMixin
 ):
     """Tests the User API registration endpoint with Google authentication."""
 